@@ -0,0 +1,9 @@
+from typing import Any, Generator, List
+
+__version__: str
+
+class sendable_list(List[Any]): ...
+
+def items_coro(
+    target: sendable_list, prefix: str, *, use_float: bool = ...
+) -> Generator[None, bytes, None]: ...
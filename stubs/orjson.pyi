@@ -0,0 +1,3 @@
+from typing import Any, Union
+
+def loads(obj: Union[bytes, bytearray, memoryview, str]) -> Any: ...
@@ -8,6 +8,8 @@ GET: str
 POST: str
 PUT: str
 
+calls: Any
+
 def add(
     method: Optional[str] = None,
     url: Optional[str] = None,
@@ -20,6 +20,7 @@ from tamr_client._types import (
     AnyDataset,
     Attribute,
     AttributeMapping,
+    AttributeSpec,
     AttributeType,
     Backup,
     CategorizationProject,
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe in-memory cache with least-recently-used eviction and time-based expiry
+
+    Args:
+        maxsize: Maximum number of entries. Least recently used entries are evicted first.
+        ttl: Number of seconds after which an entry expires
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the cached value for `key`, or `None` if it is missing or expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if time.monotonic() < expires_at:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        """Cache `value` for `key`, evicting the least recently used entry if full"""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, key: str):
+        """Remove the entry for `key`, if any"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries and reset statistics"""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of cache `hits`, `misses` and `evictions`, and current `size`"""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
@@ -1,6 +1,7 @@
 from tamr_client._types.attribute import (
     Array,
     Attribute,
+    AttributeSpec,
     AttributeType,
     BOOLEAN,
     ComplexType,
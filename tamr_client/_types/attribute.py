@@ -3,6 +3,7 @@ This module includes:
 - SubAttribute
 - AttributeType
 - Attribute
+- AttributeSpec
 
 The definition order is chosen to minimize the number of forward references.
 See https://www.python.org/dev/peps/pep-0484/#forward-references
@@ -154,3 +155,22 @@ class Attribute:
     type: AttributeType
     is_nullable: bool
     description: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class AttributeSpec:
+    """Specification for a new attribute.
+
+    See :func:`~tamr_client.attribute.create_many`
+
+    Args:
+        name
+        is_nullable
+        type
+        description
+    """
+
+    name: str
+    is_nullable: bool
+    type: AttributeType = DEFAULT
+    description: Optional[str] = None
@@ -1,21 +1,49 @@
+import threading
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from tamr_client._types.auth import UsernamePasswordAuth
 
 
+def _adapter() -> HTTPAdapter:
+    """HTTP adapter that keeps connections alive and pooled across requests.
+
+    Idempotent requests are retried with backoff on transient gateway errors.
+    Once retries are exhausted, the last response is returned as-is.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+    )
+    return HTTPAdapter(pool_connections=10, pool_maxsize=64, max_retries=retry)
+
+
 class Session(requests.Session):
     def __init__(self):
         super(self.__class__, self).__init__()
         self._stored_auth: Optional[UsernamePasswordAuth] = None
+        # Serializes auth refreshes when the session is shared between threads.
+        # Reentrant so that a refresh can never deadlock its own thread.
+        self._auth_lock = threading.RLock()
+        self.mount("http://", _adapter())
+        self.mount("https://", _adapter())
 
     def request(self, *args, **kwargs):
         # signature of `requests` requires not naming positional args
+        # `get_dict` does not raise if cookies for multiple domains share the name
+        auth_token = self.cookies.get_dict().get("authToken")
         response = super(self.__class__, self).request(*args, **kwargs)
         if response.status_code == 401 and "credentials" in response.text.lower():
             first_response = response
-            self._set_auth_cookie(args[1])
+            with self._auth_lock:
+                # Skip login if another thread refreshed the token in the meantime
+                if self.cookies.get_dict().get("authToken") == auth_token:
+                    self._set_auth_cookie(args[1])
             response = super(self.__class__, self).request(*args, **kwargs)
             if response.status_code == 401 and "credentials" in response.text.lower():
                 # Login credentials are bad, return original response
@@ -29,8 +57,10 @@ class Session(requests.Session):
             return
 
         # Fetch auth token and store as cookie
+        # Bypass `Session.request` so a rejected login is not itself retried with a login
         socket_address = parent_url.split("/api/")[0]
-        r = self.post(
+        r = super(Session, self).request(
+            "POST",
             socket_address + "/api/versioned/v1/instance:login",
             json={
                 "username": self._stored_auth.username,
@@ -3,13 +3,19 @@ from tamr_client.attribute import type
 from tamr_client.attribute._attribute import (
     _from_json,
     _get_all_from_parent,
+    _iter_from_parent,
     AlreadyExists,
     by_resource_id,
+    cache_stats,
     CannotCreateAttributesOnUnifiedDataset,
     create,
+    create_many,
     delete,
+    delete_many,
+    invalidate,
     NotFound,
     ReservedName,
     to_json,
     update,
+    update_many,
 )
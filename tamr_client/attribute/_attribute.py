@@ -1,13 +1,29 @@
 """
 See https://docs.tamr.com/reference/attribute-types
 """
-from copy import deepcopy
-from dataclasses import replace
-from typing import Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+import threading
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+import requests
 
 from tamr_client import response
+from tamr_client._cache import TTLCache
 from tamr_client._types import (
     Attribute,
+    AttributeSpec,
     AttributeType,
     Dataset,
     JsonDict,
@@ -40,6 +56,15 @@ _RESERVED_NAMES = frozenset(
 
 Parent = Union[Dataset, Project]
 
+T = TypeVar("T")
+
+_MAX_WORKERS = 32
+
+# Opt-in caches for attribute reads, one per session so that cached attributes are only
+# returned to the credentials that fetched them. Each cache is keyed by attribute URL.
+_caches: "WeakKeyDictionary[Session, TTLCache]" = WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
 
 class AlreadyExists(TamrClientException):
     """Raised when trying to create an attribute that already exists on the server"""
@@ -68,7 +93,11 @@ class CannotCreateAttributesOnUnifiedDataset(TamrClientException):
 
 
 def by_resource_id(
-    session: Session, parent: Union[Dataset, Project], id: str
+    session: Session,
+    parent: Union[Dataset, Project],
+    id: str,
+    *,
+    use_cache: bool = False,
 ) -> Attribute:
     """Get attribute by resource ID
 
@@ -77,34 +106,91 @@ def by_resource_id(
     Args:
         parent: Dataset or project containing this attribute
         id: Attribute ID
+        use_cache: If `True`, reuse the attribute fetched by a previous cached call
+            for this URL within the last minute instead of fetching it again.
+            Cached attributes are only reused for the same `session`.
+            The cached entry is invalidated when the attribute is updated or deleted via
+            this package. See :func:`~tamr_client.attribute.invalidate`.
 
     Raises:
         attribute.NotFound: If no attribute could be found at the specified URL.
             Corresponds to a 404 HTTP error.
         requests.HTTPError: If any other HTTP error is encountered.
     """
-    url = replace(parent.url, path=parent.url.path + f"/attributes/{id}")
-    return _by_url(session, url)
+    url = _child_url(parent.url, f"/attributes/{id}")
+    return _by_url(session, url, use_cache=use_cache)
 
 
-def _by_url(session: Session, url: URL) -> Attribute:
+def _child_url(url: URL, suffix: str) -> URL:
+    """Make the URL at `suffix` relative to `url`
+
+    Constructs the URL directly, which is cheaper than `dataclasses.replace`.
+    """
+    return URL(path=url.path + suffix, instance=url.instance, base_path=url.base_path)
+
+
+def _by_url(session: Session, url: URL, *, use_cache: bool = False) -> Attribute:
     """Get attribute by URL
 
     Fetches attribute from Tamr server
 
     Args:
         url: Attribute URL
+        use_cache: If `True`, check the attribute cache before fetching
 
     Raises:
         attribute.NotFound: If no attribute could be found at the specified URL.
             Corresponds to a 404 HTTP error.
         requests.HTTPError: If any other HTTP error is encountered.
     """
+    if use_cache:
+        cached = _cache(session).get(str(url))
+        if cached is not None:
+            return cached
+
     r = session.get(str(url))
     if r.status_code == 404:
         raise NotFound(str(url))
-    data = response.successful(r).json()
-    return _from_json(url, data)
+    data = response.json(response.successful(r))
+    attr = _from_json(url, data)
+
+    if use_cache:
+        _cache(session).put(str(url), attr)
+    return attr
+
+
+def _cache(session: Session) -> TTLCache:
+    """Get the attribute cache for `session`, creating it if necessary"""
+    with _caches_lock:
+        cache = _caches.get(session)
+        if cache is None:
+            cache = TTLCache(maxsize=1024, ttl=60.0)
+            _caches[session] = cache
+        return cache
+
+
+def invalidate(url: URL):
+    """Remove an attribute from the attribute cache of every session
+
+    Only needed if the attribute was changed outside of this package,
+    e.g. by another client or in the Tamr UI.
+
+    Args:
+        url: Attribute URL
+    """
+    with _caches_lock:
+        caches = list(_caches.values())
+    for cache in caches:
+        cache.invalidate(str(url))
+
+
+def cache_stats(session: Session) -> Dict[str, int]:
+    """Get attribute cache statistics for a session
+
+    Returns:
+        Counts of cache `hits`, `misses` and `evictions`, and the current cache `size`
+    """
+    return _cache(session).stats()
 
 
 def _from_json(url: URL, data: JsonDict) -> Attribute:
@@ -114,13 +200,12 @@ def _from_json(url: URL, data: JsonDict) -> Attribute:
         url: Attribute URL
         data: Attribute JSON data from Tamr server
     """
-    cp = deepcopy(data)
     return Attribute(
         url,
-        name=cp["name"],
-        description=cp.get("description"),
-        is_nullable=cp["isNullable"],
-        type=attribute_type.from_json(cp["type"]),
+        name=data["name"],
+        description=data.get("description"),
+        is_nullable=data["isNullable"],
+        type=attribute_type.from_json(data["type"]),
     )
 
 
@@ -192,6 +277,70 @@ def create(
     )
 
 
+def create_many(
+    session: Session,
+    parent: Parent,
+    specs: Sequence[AttributeSpec],
+    *,
+    max_workers: int = _MAX_WORKERS,
+) -> Tuple[Attribute, ...]:
+    """Create many attributes concurrently
+
+    All specs are checked before any creation request is posted to the Tamr server.
+    The Tamr API has no bulk attribute creation endpoint,
+    so one request is sent per attribute, with at most `max_workers` requests in flight.
+
+    All requests are attempted even if some of them fail.
+    On error, an unknown subset of the attributes was created and none are returned;
+    use e.g. :func:`~tamr_client.dataset.attributes` to find out which.
+
+    Args:
+        parent: Dataset or project that should contain the new attributes
+        specs: Specifications of the new attributes
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        The newly created attributes, in the same order as `specs`
+
+    Raises:
+        TypeError: If any spec is not an :class:`~tamr_client.AttributeSpec`.
+        ValueError: If two specs have the same `name`.
+        attribute.ReservedName: If any attribute name is reserved.
+        attribute.AlreadyExists: If an attribute already exists at one of the specified URLs.
+            Corresponds to a 409 HTTP error.
+        requests.HTTPError: If any other HTTP error is encountered.
+    """
+    for spec in specs:
+        if not isinstance(spec, AttributeSpec):
+            raise TypeError(f"Expected AttributeSpec, got {spec!r}")
+
+    names = {spec.name for spec in specs}
+    if len(names) != len(specs):
+        raise ValueError("Attribute specs must have unique names")
+
+    reserved = names & _RESERVED_NAMES
+    if reserved:
+        raise ReservedName(", ".join(sorted(reserved)))
+
+    if isinstance(parent, UnifiedDataset):
+        raise CannotCreateAttributesOnUnifiedDataset(
+            "Attributes for unified datasets must be created as attributes of the "
+            "containing project"
+        )
+
+    def _create_from_spec(spec: AttributeSpec) -> Attribute:
+        return _create(
+            session,
+            parent,
+            name=spec.name,
+            is_nullable=spec.is_nullable,
+            type=spec.type,
+            description=spec.description,
+        )
+
+    return _concurrently(_create_from_spec, specs, max_workers=max_workers)
+
+
 def _create(
     session: Session,
     parent: Parent,
@@ -204,8 +353,8 @@ def _create(
     """Same as `tc.attribute.create`, but does not check for reserved attribute
     names.
     """
-    attrs_url = replace(parent.url, path=parent.url.path + "/attributes")
-    url = replace(attrs_url, path=attrs_url.path + f"/{name}")
+    attrs_url = _child_url(parent.url, "/attributes")
+    url = _child_url(attrs_url, f"/{name}")
 
     body = {
         "name": name,
@@ -215,10 +364,14 @@ def _create(
     if description is not None:
         body["description"] = description
 
-    r = session.post(str(attrs_url), json=body)
+    try:
+        r = session.post(str(attrs_url), json=body)
+    finally:
+        # after the write, so a concurrent cached read cannot re-cache the old state
+        invalidate(url)
     if r.status_code == 409:
         raise AlreadyExists(str(url))
-    data = response.successful(r).json()
+    data = response.json(response.successful(r))
 
     return _from_json(url, data)
 
@@ -243,10 +396,13 @@ def update(
         requests.HTTPError: If any other HTTP error is encountered.
     """
     updates = {"description": description}
-    r = session.put(str(attribute.url), json=updates)
+    try:
+        r = session.put(str(attribute.url), json=updates)
+    finally:
+        invalidate(attribute.url)
     if r.status_code == 404:
         raise NotFound(str(attribute.url))
-    data = response.successful(r).json()
+    data = response.json(response.successful(r))
     return _from_json(attribute.url, data)
 
 
@@ -263,12 +419,92 @@ def delete(session: Session, attribute: Attribute):
             Corresponds to a 404 HTTP error.
         requests.HTTPError: If any other HTTP error is encountered.
     """
-    r = session.delete(str(attribute.url))
+    try:
+        r = session.delete(str(attribute.url))
+    finally:
+        invalidate(attribute.url)
     if r.status_code == 404:
         raise NotFound(str(attribute.url))
     response.successful(r)
 
 
+def update_many(
+    session: Session,
+    updates: Mapping[Attribute, Optional[str]],
+    *,
+    max_workers: int = _MAX_WORKERS,
+) -> Tuple[Attribute, ...]:
+    """Update many existing attributes concurrently
+
+    The Tamr API has no bulk attribute update endpoint,
+    so one update request is sent per attribute, with at most `max_workers` requests in flight.
+
+    All requests are attempted even if some of them fail.
+    On error, an unknown subset of the updates was applied.
+
+    Args:
+        updates: Updated description for each existing attribute to update
+        max_workers: Maximum number of concurrent requests
+
+    Returns:
+        The newly updated attributes, in the same order as `updates`
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at one of the specified URLs.
+            Corresponds to a 404 HTTP error.
+        requests.HTTPError: If any other HTTP error is encountered.
+    """
+
+    def _update(attribute: Attribute, description: Optional[str]) -> Attribute:
+        return update(session, attribute, description=description)
+
+    return _concurrently(
+        _update, updates.keys(), updates.values(), max_workers=max_workers
+    )
+
+
+def delete_many(
+    session: Session,
+    attributes: Sequence[Attribute],
+    *,
+    max_workers: int = _MAX_WORKERS,
+):
+    """Delete many existing attributes concurrently
+
+    Sends one deletion request per attribute, with at most `max_workers` requests in flight.
+
+    All requests are attempted even if some of them fail.
+    On error, an unknown subset of the attributes was deleted.
+
+    Args:
+        attributes: Existing attributes to delete
+        max_workers: Maximum number of concurrent requests
+
+    Raises:
+        attribute.NotFound: If no attribute could be found at one of the specified URLs.
+            Corresponds to a 404 HTTP error.
+        requests.HTTPError: If any other HTTP error is encountered.
+    """
+
+    def _delete(attribute: Attribute):
+        return delete(session, attribute)
+
+    _concurrently(_delete, attributes, max_workers=max_workers)
+
+
+def _concurrently(
+    fn: Callable[..., T], *iterables: Iterable, max_workers: int
+) -> Tuple[T, ...]:
+    """Call `fn` on each item of `iterables` using a bounded pool of threads
+
+    Results are returned in input order.
+    All calls are made even if some of them fail.
+    The first exception raised by `fn` (in input order) is re-raised once all calls are done.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return tuple(executor.map(fn, *iterables))
+
+
 def _get_all_from_parent(session: Session, parent: Parent) -> Tuple[Attribute, ...]:
     """Get all attributes belonging to a parent entity
 
@@ -281,12 +517,37 @@ def _get_all_from_parent(session: Session, parent: Parent) -> Tuple[Attribute, .
     Raises:
         requests.HTTPError: If an HTTP error is encountered.
     """
-    attrs_url = replace(parent.url, path=parent.url.path + "/attributes")
-    r = session.get(str(attrs_url))
-    attrs_json = response.successful(r).json()
+    return tuple(_iter_from_parent(session, parent))
+
+
+def _iter_from_parent(session: Session, parent: Parent) -> Iterator[Attribute]:
+    """Stream all attributes belonging to a parent entity
+
+    The request is sent immediately, and attributes are yielded as they are parsed from
+    the response. The connection stays open until the returned iterator is exhausted
+    or closed.
+
+    Args:
+        parent: Entity to fetch attributes from
 
-    def attr_from_json(attr_json: JsonDict) -> Attribute:
-        attr_url = replace(attrs_url, path=attrs_url.path + f'/{attr_json["name"]}')
-        return _from_json(attr_url, attr_json)
+    Returns:
+        The attributes for the specified parent
 
-    return tuple(attr_from_json(attr_json) for attr_json in attrs_json)
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered.
+    """
+    attrs_url = _child_url(parent.url, "/attributes")
+    r = session.get(str(attrs_url), stream=True)
+    try:
+        response.successful(r)
+    except Exception:
+        r.close()
+        raise
+    return _iter_from_response(r, attrs_url)
+
+
+def _iter_from_response(r: requests.Response, attrs_url: URL) -> Iterator[Attribute]:
+    """Yield attributes from a successful attribute listing response, then close it"""
+    with r:
+        for attr_json in response.json_array(r):
+            yield _from_json(_child_url(attrs_url, "/" + attr_json["name"]), attr_json)
@@ -1,8 +1,6 @@
 """This module and attribute_type depend on each other.
 
 """
-from copy import deepcopy
-
 from tamr_client._types import JsonDict, SubAttribute
 from tamr_client.attribute import type as attribute_type
 
@@ -14,11 +12,10 @@ def from_json(data: JsonDict) -> SubAttribute:
         data: JSON data received from Tamr server.
     """
 
-    cp = deepcopy(data)
     d = {}
-    d["name"] = cp["name"]
-    d["is_nullable"] = cp["isNullable"]
-    d["type"] = attribute_type.from_json(cp["type"])
+    d["name"] = data["name"]
+    d["is_nullable"] = data["isNullable"]
+    d["type"] = attribute_type.from_json(data["type"])
     return SubAttribute(**d)
 
 
@@ -36,9 +36,9 @@ def from_json(data: JsonDict) -> AttributeType:
         logger.error(f"JSON data: {repr(data)}")
         raise ValueError("Missing required field 'baseType'.")
 
-    for primitive in PrimitiveType:
-        if base_type == primitive.name:
-            return primitive
+    primitive = PrimitiveType.__members__.get(base_type)
+    if primitive is not None:
+        return primitive
 
     if base_type == Array._tag:
         inner_type = data.get("innerType")
@@ -9,6 +9,7 @@ from tamr_client.dataset._dataset import (
     create,
     delete,
     get_all,
+    iter_attributes,
     materialize,
     NotFound,
 )
@@ -2,7 +2,7 @@
 See https://docs.tamr.com/reference/dataset-models
 """
 from copy import deepcopy
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 from tamr_client import operation, response
 from tamr_client._types import (
@@ -14,7 +14,7 @@ from tamr_client._types import (
     Session,
     URL,
 )
-from tamr_client.attribute import _get_all_from_parent
+from tamr_client.attribute import _get_all_from_parent, _iter_from_parent
 from tamr_client.exception import TamrClientException
 
 
@@ -138,6 +138,28 @@ def attributes(session: Session, dataset: Dataset) -> Tuple[Attribute, ...]:
     return _get_all_from_parent(session, dataset)
 
 
+def iter_attributes(session: Session, dataset: Dataset) -> Iterator[Attribute]:
+    """Stream all attributes from a dataset
+
+    Unlike :func:`~tamr_client.dataset.attributes`, attributes are yielded one at a time
+    as they are received, which is useful e.g. when searching for a single attribute.
+
+    The request is sent when this function is called, so HTTP errors are raised here
+    rather than on iteration. The connection stays open until the returned iterator is
+    exhausted or closed, e.g. via ``close()``.
+
+    Args:
+        dataset: Dataset containing the desired attributes
+
+    Returns:
+        The attributes for the specified dataset
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered.
+    """
+    return _iter_from_parent(session, dataset)
+
+
 def materialize(session: Session, dataset: Dataset) -> Operation:
     """Materialize a dataset and wait for the operation to complete
     Materializing consists of updating the dataset (including records) in persistent storage (HBase) based on upstream changes to data.
@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Union
+from typing import Iterator, List, Optional, Tuple, Union
 
 from tamr_client import response
 from tamr_client._types import (
@@ -10,7 +10,7 @@ from tamr_client._types import (
     UnknownProject,
     URL,
 )
-from tamr_client.attribute import _get_all_from_parent
+from tamr_client.attribute import _get_all_from_parent, _iter_from_parent
 from tamr_client.categorization import project as categorization_project
 from tamr_client.exception import TamrClientException
 from tamr_client.golden_records import project as golden_records_project
@@ -222,3 +222,25 @@ def attributes(session: Session, project: Project) -> Tuple[Attribute, ...]:
         requests.HTTPError: If an HTTP error is encountered.
     """
     return _get_all_from_parent(session, project)
+
+
+def iter_attributes(session: Session, project: Project) -> Iterator[Attribute]:
+    """Stream all attributes from a project
+
+    Unlike :func:`~tamr_client.project.attributes`, attributes are yielded one at a time
+    as they are received, which is useful e.g. when searching for a single attribute.
+
+    The request is sent when this function is called, so HTTP errors are raised here
+    rather than on iteration. The connection stays open until the returned iterator is
+    exhausted or closed, e.g. via ``close()``.
+
+    Args:
+        project: Project containing the desired attributes
+
+    Returns:
+        The attributes for the specified project
+
+    Raises:
+        requests.HTTPError: If an HTTP error is encountered.
+    """
+    return _iter_from_parent(session, project)
@@ -1,6 +1,6 @@
-import json
+from json import loads as _stdlib_loads
 import logging
-from typing import Iterator
+from typing import Any, Callable, Iterator, Union
 
 import requests
 
@@ -8,6 +8,27 @@ from tamr_client._types import JsonDict
 
 logger = logging.getLogger(__name__)
 
+# Use orjson (>= 3.0) for faster parsing of attribute payloads when it is installed.
+# Only used by `json`: orjson rejects `NaN`/`Infinity` and loses precision on big integers,
+# both of which may appear in record data.
+_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    _loads = _stdlib_loads
+
+# Use ijson (>= 3.1, for `items_coro` with `use_float`) to parse JSON arrays
+# incrementally when it is installed
+try:
+    import ijson
+
+    _ijson_version = tuple(int(x) for x in ijson.__version__.split(".")[:2])
+    _HAS_IJSON = _ijson_version >= (3, 1) and hasattr(ijson, "items_coro")
+except (ImportError, AttributeError, ValueError):
+    _HAS_IJSON = False
+
 
 def successful(response: requests.Response) -> requests.Response:
     """Ensure response does not contain an HTTP error.
@@ -31,6 +52,29 @@ def successful(response: requests.Response) -> requests.Response:
     return response
 
 
+def json(response: requests.Response) -> Any:
+    """Parse the response body as JSON
+
+    Analog to :func:`requests.Response.json`, but uses `orjson <https://github.com/ijl/orjson>`_
+    (version 3.0 or newer) for faster parsing if it is installed.
+    Intended for Tamr metadata (e.g. attributes), not record data:
+    orjson rejects ``NaN`` and ``Infinity`` and does not preserve integers beyond 64 bits.
+
+    Args:
+        response: Response whose body should be parsed as JSON.
+
+    Returns:
+        The response body, parsed as JSON
+
+    Example:
+        >>> import tamr_client as tc
+        >>> s = tc.session.from_auth(...)
+        >>> r = s.get(...)
+        >>> data = tc.response.json(tc.response.successful(r))
+    """
+    return _loads(response.content)
+
+
 def ndjson(response: requests.Response, **kwargs) -> Iterator[JsonDict]:
     """Stream newline-delimited JSON from the response body
 
@@ -54,4 +98,41 @@ def ndjson(response: requests.Response, **kwargs) -> Iterator[JsonDict]:
 
     """
     for line in response.iter_lines(**kwargs):
-        yield json.loads(line)
+        yield _stdlib_loads(line)
+
+
+def json_array(response: requests.Response, chunk_size: int = 65536) -> Iterator[Any]:
+    """Stream the items of a JSON array from the response body
+
+    Uses `ijson <https://github.com/ICRAR/ijson>`_ (version 3.1 or newer) to parse items
+    incrementally if it is installed.
+    Otherwise, the whole body is parsed at once via :func:`~tamr_client.response.json`.
+
+    **Recommended**: For memory efficiency, use ``stream=True`` when sending the request corresponding to this response.
+
+    Args:
+        response: Response whose body is a JSON array.
+        chunk_size: Number of bytes to read from the response body at a time.
+
+    Returns:
+        Each item of the JSON array, parsed as JSON
+
+    Example:
+        >>> import tamr_client as tc
+        >>> s = tc.session.from_auth(...)
+        >>> r = s.get(..., stream=True)
+        >>> for data in tc.response.json_array(r):
+        ...     assert data['my key'] == 'my_value'
+    """
+    if not _HAS_IJSON:
+        yield from json(response)
+        return
+
+    items = ijson.sendable_list()
+    parser = ijson.items_coro(items, "item", use_float=True)
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        parser.send(chunk)
+        yield from items
+        del items[:]
+    parser.close()
+    yield from items
@@ -1,7 +1,6 @@
 """
 See https://docs.tamr.com/new/reference/retrieve-projects-mappings
 """
-from copy import deepcopy
 from typing import Dict, List, Optional, Tuple
 
 from tamr_client import attribute, dataset, response
@@ -140,15 +139,14 @@ def _get(
     """
     if attribute_memo is None:
         attribute_memo = {}
-    cp = deepcopy(data)
-    input_attribute_url = URL(instance=instance, path=cp["relativeInputAttributeId"])
+    input_attribute_url = URL(instance=instance, path=data["relativeInputAttributeId"])
     unified_attribute_url = URL(
-        instance=instance, path=cp["relativeUnifiedAttributeId"]
+        instance=instance, path=data["relativeUnifiedAttributeId"]
     )
 
     if input_attribute_url not in attribute_memo:
         attr_dataset = dataset.by_resource_id(
-            session, instance, cp["relativeInputAttributeId"].split("/")[1]
+            session, instance, data["relativeInputAttributeId"].split("/")[1]
         )
         attribute_memo = {
             **attribute_memo,
@@ -156,7 +154,7 @@ def _get(
         }
     if unified_attribute_url not in attribute_memo:
         attr_dataset = dataset.by_resource_id(
-            session, instance, cp["relativeUnifiedAttributeId"].split("/")[1]
+            session, instance, data["relativeUnifiedAttributeId"].split("/")[1]
         )
         attribute_memo = {
             **attribute_memo,
@@ -165,7 +163,7 @@ def _get(
 
     return (
         AttributeMapping(
-            url=URL(instance=instance, path=cp["relativeId"]),
+            url=URL(instance=instance, path=data["relativeId"]),
             input_attribute=attribute_memo[input_attribute_url],
             unified_attribute=attribute_memo[unified_attribute_url],
         ),
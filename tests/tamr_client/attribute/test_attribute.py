@@ -1,4 +1,7 @@
+from dataclasses import replace
+
 import pytest
+import responses
 
 import tamr_client as tc
 from tests.tamr_client import fake, utils
@@ -59,6 +62,92 @@ def test_create():
     assert attr.description == "an attribute"
 
 
+@fake.json
+def test_create_default_type():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    attr = tc.attribute.create(s, dataset, name="attr", is_nullable=True)
+
+    assert attr.name == "attr"
+    assert attr.type == tc.attribute.type.DEFAULT
+
+
+@fake.json
+def test_create_many():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    # Single worker so that requests are sent in the order of the faked responses
+    attrs = tc.attribute.create_many(
+        s,
+        dataset,
+        [
+            tc.AttributeSpec(name="first", is_nullable=True),
+            tc.AttributeSpec(
+                name="second",
+                is_nullable=False,
+                type=tc.attribute.type.STRING,
+                description="second attribute",
+            ),
+        ],
+        max_workers=1,
+    )
+
+    assert [attr.name for attr in attrs] == ["first", "second"]
+    assert attrs[0].type == tc.attribute.type.DEFAULT
+    assert attrs[1].type == tc.attribute.type.STRING
+    assert attrs[1].description == "second attribute"
+
+
+def test_create_many_reserved_attribute_name():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(tc.attribute.ReservedName):
+        tc.attribute.create_many(
+            s,
+            dataset,
+            [
+                tc.AttributeSpec(name="attr", is_nullable=False),
+                tc.AttributeSpec(name="tamr_id", is_nullable=False),
+            ],
+        )
+
+
+def test_create_many_duplicate_names():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(ValueError):
+        tc.attribute.create_many(
+            s,
+            dataset,
+            [
+                tc.AttributeSpec(name="attr", is_nullable=False),
+                tc.AttributeSpec(name="attr", is_nullable=True),
+            ],
+        )
+
+
+@responses.activate
+def test_create_many_bad_spec():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(TypeError):
+        tc.attribute.create_many(
+            s,
+            dataset,
+            [
+                tc.AttributeSpec(name="good", is_nullable=True),
+                dict(name="bad", nullable=True),  # type: ignore
+            ],
+        )
+
+    assert len(responses.calls) == 0
+
+
 @fake.json
 def test_create_project_attribute():
     s = fake.session()
@@ -111,6 +200,46 @@ def test_delete():
     tc.attribute.delete(s, attr)
 
 
+@fake.json
+def test_update_many():
+    s = fake.session()
+    row_num = fake.attribute()
+    source_row_num = replace(
+        fake.attribute(),
+        url=tc.URL(path="datasets/1/attributes/SourceRowNum"),
+        name="SourceRowNum",
+    )
+
+    updated_attrs = tc.attribute.update_many(
+        s,
+        {
+            row_num: "Synthetic row number updated",
+            source_row_num: "Source row number updated",
+        },
+    )
+
+    assert [attr.name for attr in updated_attrs] == ["RowNum", "SourceRowNum"]
+    assert [attr.description for attr in updated_attrs] == [
+        "Synthetic row number updated",
+        "Source row number updated",
+    ]
+
+
+@fake.json
+def test_delete_many():
+    s = fake.session()
+    attrs = (
+        fake.attribute(),
+        replace(
+            fake.attribute(),
+            url=tc.URL(path="datasets/1/attributes/SourceRowNum"),
+            name="SourceRowNum",
+        ),
+    )
+
+    tc.attribute.delete_many(s, attrs)
+
+
 @fake.json
 def test_by_resource_id():
     s = fake.session()
@@ -135,6 +264,49 @@ def test_by_resource_id():
     assert attr.type.attributes == attrs
 
 
+@fake.json
+def test_by_resource_id_cached():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    attr = tc.attribute.by_resource_id(s, dataset, "cached", use_cache=True)
+    cached_attr = tc.attribute.by_resource_id(s, dataset, "cached", use_cache=True)
+
+    assert cached_attr is attr
+    assert tc.attribute.cache_stats(s)["hits"] == 1
+
+    tc.attribute.invalidate(attr.url)
+    tc.attribute.by_resource_id(s, dataset, "cached", use_cache=True)
+    assert tc.attribute.cache_stats(s)["hits"] == 1
+
+
+@fake.json
+def test_by_resource_id_cached_per_session():
+    s = fake.session()
+    other_session = fake.session()
+    dataset = fake.dataset()
+
+    attr = tc.attribute.by_resource_id(s, dataset, "cached", use_cache=True)
+    other_attr = tc.attribute.by_resource_id(
+        other_session, dataset, "cached", use_cache=True
+    )
+
+    assert other_attr is not attr
+    assert tc.attribute.cache_stats(other_session)["hits"] == 0
+
+
+@fake.json
+def test_by_resource_id_cached_after_update():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    attr = tc.attribute.by_resource_id(s, dataset, "RowNum", use_cache=True)
+    tc.attribute.update(s, attr, description="Synthetic row number updated")
+    cached_attr = tc.attribute.by_resource_id(s, dataset, "RowNum", use_cache=True)
+
+    assert cached_attr.description == "Synthetic row number updated"
+
+
 @fake.json
 def test_by_resource_id_attribute_not_found():
     s = fake.session()
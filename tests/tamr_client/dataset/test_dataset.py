@@ -1,4 +1,5 @@
 import pytest
+import requests
 
 import tamr_client as tc
 from tests.tamr_client import fake
@@ -69,6 +70,31 @@ def test_attributes():
     assert isinstance(geom.type, tc.attribute.type.Record)
 
 
+@fake.json
+def test_iter_attributes_http_error():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    with pytest.raises(requests.HTTPError):
+        tc.dataset.iter_attributes(s, dataset)
+
+
+@fake.json
+def test_iter_attributes():
+    s = fake.session()
+    dataset = fake.dataset()
+
+    attrs = tc.dataset.iter_attributes(s, dataset)
+
+    row_num = next(attrs)
+    assert row_num.name == "RowNum"
+    assert row_num.type == tc.attribute.type.STRING
+
+    geom = next(attrs)
+    assert geom.name == "geom"
+    assert isinstance(geom.type, tc.attribute.type.Record)
+
+
 @fake.json
 def test_materialize_async():
     s = fake.session()
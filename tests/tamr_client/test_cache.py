@@ -0,0 +1,23 @@
+from tamr_client._cache import TTLCache
+
+
+def test_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"hits": 3, "misses": 1, "evictions": 1, "size": 2}
+
+
+def test_expires_entries():
+    cache = TTLCache(maxsize=2, ttl=0.0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
@@ -161,3 +161,19 @@ def test_attributes():
     geom = attrs[1]
     assert geom.name == "geom"
     assert isinstance(geom.type, tc.attribute.type.Record)
+
+
+@fake.json
+def test_iter_attributes():
+    s = fake.session()
+    project = fake.mastering_project()
+
+    attrs = tc.project.iter_attributes(s, project)
+
+    row_num = next(attrs)
+    assert row_num.name == "RowNum"
+    assert row_num.type == tc.attribute.type.STRING
+
+    geom = next(attrs)
+    assert geom.name == "geom"
+    assert isinstance(geom.type, tc.attribute.type.Record)
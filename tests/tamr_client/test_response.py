@@ -1,4 +1,5 @@
 import json
+import math
 
 import responses
 
@@ -6,6 +7,48 @@ import tamr_client as tc
 from tests.tamr_client import fake
 
 
+@responses.activate
+def test_json():
+    s = fake.session()
+
+    data = [{"a": 1}, {"b": [2.5, None]}, {"c": "three"}]
+    url = tc.URL(path="datasets/1/attributes")
+    responses.add(responses.GET, str(url), body=json.dumps(data))
+
+    r = s.get(str(url))
+
+    assert tc.response.json(r) == data
+
+
+@responses.activate
+def test_json_array():
+    s = fake.session()
+
+    data = [{"a": 1}, {"b": [2.5, None]}, {"c": "three"}]
+    url = tc.URL(path="datasets/1/attributes")
+    responses.add(responses.GET, str(url), body=json.dumps(data))
+
+    r = s.get(str(url), stream=True)
+
+    assert list(tc.response.json_array(r, chunk_size=8)) == data
+
+
+@responses.activate
+def test_ndjson_non_finite_and_big_numbers():
+    s = fake.session()
+
+    url = tc.URL(path="datasets/1/records")
+    body = '{"a": NaN}\n{"b": Infinity}\n{"c": 123456789012345678901234567890}'
+    responses.add(responses.GET, str(url), body=body)
+
+    r = s.get(str(url))
+
+    records = list(tc.response.ndjson(r))
+    assert math.isnan(records[0]["a"])
+    assert records[1]["b"] == math.inf
+    assert records[2]["c"] == 123456789012345678901234567890
+
+
 @responses.activate
 def test_ndjson():
     s = fake.session()
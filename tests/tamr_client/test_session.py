@@ -3,6 +3,7 @@ import json
 
 import pytest
 import requests
+from requests.adapters import HTTPAdapter
 import responses
 
 import tamr_client as tc
@@ -123,4 +124,74 @@ def test_request_headers():
     assert snoop_dict_3["headers"]["Cookie"] == f'authToken={auth_json["token"]}'
 
 
+@responses.activate
+def test_login_rejected():
+    s = fake.session()
+    instance = fake.instance()
+    responses.add(
+        responses.GET,
+        "http://localhost/api/versioned/v1/backups",
+        status=401,
+        body="Credentials are required to access this resource.",
+    )
+    responses.add(
+        responses.POST,
+        "http://localhost/api/versioned/v1/instance:login",
+        status=401,
+        body="Bad credentials",
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        tc.backup.get_all(session=s, instance=instance)
+
+    assert s.auth == fake.username_password_auth()
+
+
+@responses.activate
+def test_duplicate_auth_cookies():
+    s = fake.session()
+    instance = fake.instance()
+    s.cookies.set("authToken", "client_token")
+    s.cookies.set("authToken", "server_token", domain="localhost.local")
+    responses.add(
+        responses.GET, "http://localhost/api/versioned/v1/backups", body="[]"
+    )
+
+    assert tc.backup.get_all(session=s, instance=instance) == []
+
+
+@responses.activate
+def test_skip_login_if_refreshed_concurrently():
+    s = fake.session()
+    instance = fake.instance()
+    s.cookies.set("authToken", "expired_auth_token")
+    endpoint = "http://localhost/api/versioned/v1/backups"
+
+    def expired_callback(request, session):
+        # Another thread refreshes the token while this request is in flight
+        session.cookies.set("authToken", auth_json["token"])
+        return 401, {}, "Credentials are required to access this resource."
+
+    responses.add_callback(
+        responses.GET, endpoint, partial(expired_callback, session=s)
+    )
+    responses.add(responses.GET, endpoint, body="[]")
+
+    # No login request is registered, so logging in again would fail
+    tc.backup.get_all(session=s, instance=instance)
+
+    assert s.cookies.get("authToken") == auth_json["token"]
+
+
+def test_pooled_adapters():
+    s = fake.session()
+
+    for prefix in ("http://", "https://"):
+        adapter = s.get_adapter(prefix + "localhost")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter.max_retries.total == 3
+        assert set(adapter.max_retries.status_forcelist) == {502, 503, 504}
+        assert not adapter.max_retries.raise_on_status
+
+
 auth_json = {"token": "auth_token_string_value", "username": "user"}